@@ -0,0 +1,54 @@
+import contextlib
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class PageCache:
+    """
+    On-disk cache of fetched review pages, keyed by page URL (which encodes
+    the ASIN and page number). Entries are gzip-compressed HTML files and
+    expire ``ttl`` seconds after they were written.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url: str) -> Optional[bytes]:
+        path = self._path_for(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with gzip.open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as exc:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+
+    def put(self, url: str, html: bytes) -> None:
+        path = self._path_for(url)
+        tmp_path = None
+        try:
+            # Write to a temp file and rename so readers never see a partial entry.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(html)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write cache entry %s: %s", path, exc)
+            if tmp_path:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+    def _path_for(self, url: str) -> str:
+        key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{key}.html.gz")
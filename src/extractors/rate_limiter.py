@@ -0,0 +1,47 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by the sync and async fetch paths.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each acquire reserves a token up front and then waits, outside the lock,
+    until that token has been refilled. Concurrent workers therefore queue in
+    order without serializing on the sleep itself. A non-positive rate
+    disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait for it.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
@@ -0,0 +1,96 @@
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+@dataclass
+class ReviewColumns:
+    """
+    Column-oriented (struct-of-arrays) buffer of scraped reviews.
+
+    Each review field lives in its own list, numeric fields in compact
+    ``array`` buffers, which is far smaller than one dict per review and can be
+    handed to pandas/pyarrow without per-row conversion. Missing rating scores
+    are stored as NaN.
+    """
+
+    product_asin: List[str] = field(default_factory=list)
+    rating_score: array = field(default_factory=lambda: array("d"))
+    review_title: List[str] = field(default_factory=list)
+    review_url: List[str] = field(default_factory=list)
+    review_reaction: List[str] = field(default_factory=list)
+    reviewed_in: List[str] = field(default_factory=list)
+    review_description: List[str] = field(default_factory=list)
+    is_verified: bytearray = field(default_factory=bytearray)
+    variant: List[str] = field(default_factory=list)
+    review_images: List[List[str]] = field(default_factory=list)
+    position: array = field(default_factory=lambda: array("I"))
+    helpful_votes: array = field(default_factory=lambda: array("i"))
+
+    def __len__(self) -> int:
+        return len(self.product_asin)
+
+    def append(self, review: Dict[str, Any]) -> None:
+        rating: Optional[float] = review["ratingScore"]
+        self.product_asin.append(review["productAsin"])
+        self.rating_score.append(math.nan if rating is None else rating)
+        self.review_title.append(review["reviewTitle"])
+        self.review_url.append(review["reviewUrl"])
+        self.review_reaction.append(review["reviewReaction"])
+        self.reviewed_in.append(review["reviewedIn"])
+        self.review_description.append(review["reviewDescription"])
+        self.is_verified.append(1 if review["isVerified"] else 0)
+        self.variant.append(review["variant"])
+        self.review_images.append(review["reviewImages"])
+        self.position.append(review["position"])
+        self.helpful_votes.append(review["helpfulVotes"])
+
+    def extend(self, reviews: Iterable[Dict[str, Any]]) -> None:
+        for review in reviews:
+            self.append(review)
+
+    def to_columns(self) -> Dict[str, Any]:
+        """
+        Return the columns keyed by the same field names as the review dicts.
+        """
+        return {
+            "productAsin": self.product_asin,
+            "ratingScore": self.rating_score,
+            "reviewTitle": self.review_title,
+            "reviewUrl": self.review_url,
+            "reviewReaction": self.review_reaction,
+            "reviewedIn": self.reviewed_in,
+            "reviewDescription": self.review_description,
+            "isVerified": [bool(v) for v in self.is_verified],
+            "variant": self.variant,
+            "reviewImages": self.review_images,
+            "position": self.position,
+            "helpfulVotes": self.helpful_votes,
+        }
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Convert back to the row-oriented dicts produced by the scraper, e.g. for
+        the JSON/CSV exporters.
+        """
+        columns = self.to_columns()
+        keys = list(columns)
+        rows = [dict(zip(keys, values)) for values in zip(*columns.values())]
+        for row in rows:
+            if math.isnan(row["ratingScore"]):
+                row["ratingScore"] = None
+        return rows
+
+    def to_pandas(self) -> Any:
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise ImportError("ReviewColumns.to_pandas() requires pandas to be installed.") from exc
+        return pd.DataFrame(self.to_columns())
+
+    def to_arrow(self) -> Any:
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError("ReviewColumns.to_arrow() requires pyarrow to be installed.") from exc
+        return pa.table(self.to_columns())
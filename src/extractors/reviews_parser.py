@@ -1,16 +1,77 @@
+import asyncio
 import logging
 import re
-import time
-from typing import Dict, Iterable, List, Optional
-from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
 
+import httpx
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.retry import Retry
 
+from .page_cache import PageCache
+from .rate_limiter import TokenBucket
+from .review_columns import ReviewColumns
 from .utils_text import clean_text, parse_helpful_votes, parse_rating_score
 
 logger = logging.getLogger(__name__)
 
+# /dp/ASIN, /gp/product/ASIN, /product-reviews/ASIN or an ASIN= query parameter.
+_ASIN_RE = re.compile(
+    r"/dp/(?P<dp>[A-Z0-9]{10})"
+    r"|/gp/product/(?P<gp>[A-Z0-9]{10})"
+    r"|/product-reviews/(?P<reviews>[A-Z0-9]{10})"
+    r"|[?&]ASIN=(?P<query>[A-Z0-9]{10})"
+)
+
+# CSS selectors used per review block.
+_SEL_REVIEW_BLOCK = "div[data-hook='review']"
+_SEL_RATING = "i[data-hook='review-star-rating'] span.a-icon-alt"
+_SEL_RATING_FALLBACK = "span.a-icon-alt"
+_SEL_TITLE_LINK = "a[data-hook='review-title']"
+_SEL_REACTION = "span[data-hook='helpful-vote-statement']"
+_SEL_DATE = "span[data-hook='review-date']"
+_SEL_BODY_TEXT = "span[data-hook='review-body'] span"
+_SEL_BODY = "span[data-hook='review-body']"
+_SEL_VERIFIED = "span[data-hook='avp-badge']"
+_SEL_VARIANT = "a[data-hook='format-strip']"
+_SEL_IMAGES = "img[data-hook='review-image-tile']"
+
+_VERIFIED_MARKER = "Verified Purchase"
+
+# Raw-byte markers used to skip or trim pages before they reach the parser.
+_REVIEW_MARKERS = (b'data-hook="review"', b"data-hook='review'")
+_REVIEW_LIST_START = b"cm_cr-review_list"
+_REVIEW_LIST_END = b"</div><!--cm_cr-review_list-->"
+
+class _PacedRetry(Retry):
+    """
+    urllib3 Retry that takes a token from the scraper's rate limiter before
+    every retry and never retries sooner than backoff_factor seconds (plain
+    Retry fires the first retry immediately).
+    """
+
+    def __init__(self, *args: Any, bucket: Optional[TokenBucket] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._bucket = bucket
+
+    def new(self, **kw: Any) -> "_PacedRetry":
+        retry = super().new(**kw)
+        retry._bucket = self._bucket
+        return retry
+
+    def get_backoff_time(self) -> float:
+        return max(super().get_backoff_time(), self.backoff_factor)
+
+    def sleep(self, response: Any = None) -> None:
+        # Back off first: the token has usually refilled by then, so the waits don't stack.
+        super().sleep(response)
+        if self._bucket is not None:
+            self._bucket.acquire()
+
 class AmazonReviewsScraper:
     """
     High-level scraper that:
@@ -20,6 +81,8 @@ class AmazonReviewsScraper:
     """
 
     BASE_DOMAIN = "https://www.amazon.com"
+    CHUNK_SIZE = 64 * 1024
+    MAX_PAGE_BYTES = 4_000_000
 
     def __init__(
         self,
@@ -28,32 +91,168 @@ class AmazonReviewsScraper:
         proxy: Optional[str] = None,
         retry_count: int = 3,
         sleep_between_requests: float = 1.0,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 3600,
     ) -> None:
+        headers = {
+            "User-Agent": user_agent,
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, br",
+        }
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": user_agent,
-                "Accept-Language": "en-US,en;q=0.9",
-            }
+        self.session.headers.update(headers)
+        # HTTP/2 forbids connection-specific headers, so this stays off the httpx client.
+        self.session.headers["Connection"] = "keep-alive"
+        # Pace requests at one per sleep_between_requests seconds across all
+        # pages, workers, retries and both fetch paths.
+        self._bucket = TokenBucket(rate=1.0 / sleep_between_requests if sleep_between_requests > 0 else 0.0)
+        # retry_count is the total number of attempts, Retry.total counts retries.
+        retry = _PacedRetry(
+            bucket=self._bucket,
+            total=max(retry_count - 1, 0),
+            backoff_factor=sleep_between_requests,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
         )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.timeout = timeout
         self.retry_count = retry_count
         self.sleep_between_requests = sleep_between_requests
         self.proxies = {"http": proxy, "https": proxy} if proxy else None
 
+        self.cache = PageCache(cache_dir, ttl=cache_ttl) if cache_dir else None
+
+        # Async client used by ascrape_product_reviews; bound to the event loop
+        # it is first used in, so callers should close it with aclose().
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            proxy=proxy,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+
     # ----------------------- Public API -----------------------
 
     def scrape_product_reviews(self, product_url: str, max_reviews: int = 100) -> List[Dict]:
+        return list(self.iter_product_reviews(product_url, max_reviews))
+
+    def iter_product_reviews(self, product_url: str, max_reviews: int = 100) -> Iterator[Dict]:
+        """
+        Yield reviews one at a time as each page is parsed, so callers can start
+        processing (or saving) before the whole product has been scraped. The
+        next page is only fetched once the current one has been consumed.
+
+        The ASIN is resolved eagerly, so an unusable URL raises ValueError here
+        rather than on the first next().
+        """
+        pages = self._iter_review_pages(self._require_asin(product_url), max_reviews)
+        return islice((review for reviews in pages for review in reviews), max(max_reviews, 0))
+
+    def scrape_product_reviews_columns(self, product_url: str, max_reviews: int = 100) -> ReviewColumns:
+        """
+        Same as scrape_product_reviews, but accumulates reviews page by page
+        into a column-oriented ReviewColumns buffer instead of a list of dicts.
+        """
+        columns = ReviewColumns()
+        for reviews in self._iter_review_pages(self._require_asin(product_url), max_reviews):
+            columns.extend(reviews[: max_reviews - len(columns)])
+        return columns
+
+    def scrape_many(
+        self,
+        product_urls: List[str],
+        max_reviews: int = 100,
+        workers: int = 8,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape several products concurrently on a thread pool. All workers share
+        this scraper's session, connection pool and rate limiter. A product that
+        fails is logged and maps to an empty list.
+        """
+        results: Dict[str, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.scrape_product_reviews, url, max_reviews): url for url in product_urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("Failed to scrape %s: %s", url, exc, exc_info=True)
+                    results[url] = []
+        return results
+
+    async def ascrape_product_reviews(
+        self,
+        product_url: str,
+        max_reviews: int = 100,
+        max_concurrency: int = 4,
+    ) -> List[Dict]:
+        """
+        Async variant of scrape_product_reviews that fetches up to
+        ``max_concurrency`` review pages at a time over a shared connection pool.
+        Pages are speculatively requested in batches and processed in order;
+        pagination stops at the first empty page.
+        """
+        asin = self._require_asin(product_url)
+
+        collected: List[Dict] = []
+        next_page = 1
+        exhausted = False
+
+        while not exhausted and len(collected) < max_reviews:
+            pages = range(next_page, next_page + max(1, max_concurrency))
+            logger.debug("Fetching reviews pages %s-%s for ASIN %s", pages[0], pages[-1], asin)
+            htmls = await asyncio.gather(*(self._afetch(self._build_review_page_url(asin, p)) for p in pages))
+
+            for page, html in zip(pages, htmls):
+                if not html:
+                    logger.warning("Empty HTML returned for page %s. Stopping pagination.", page)
+                    exhausted = True
+                    break
+
+                reviews = self._parse_page(html, asin=asin, start_position=len(collected) + 1)
+                if not reviews:
+                    logger.info("No more reviews found at page %s.", page)
+                    exhausted = True
+                    break
+
+                collected.extend(reviews)
+                logger.info("Page %s yielded %d reviews (total so far: %d).", page, len(reviews), len(collected))
+
+                if len(collected) >= max_reviews:
+                    break
+
+            next_page = pages[-1] + 1
+
+        return collected[:max_reviews]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    # ----------------------- Pagination -----------------------
+
+    def _require_asin(self, product_url: str) -> str:
         asin = self._extract_asin(product_url)
         if not asin:
             raise ValueError(f"Could not determine ASIN from product URL: {product_url}")
 
         logger.info("Derived ASIN %s from URL %s", asin, product_url)
+        return asin
 
-        collected: List[Dict] = []
+    def _iter_review_pages(self, asin: str, max_reviews: int) -> Iterator[List[Dict]]:
+        """
+        Fetch and parse review pages in order, yielding each page's reviews,
+        until max_reviews have been produced or a page comes back empty.
+        """
+        total = 0
         page = 1
 
-        while len(collected) < max_reviews:
+        while total < max_reviews:
             page_url = self._build_review_page_url(asin, page)
             logger.debug("Fetching reviews page %s: %s", page, page_url)
             html = self._fetch_html_with_retries(page_url)
@@ -61,70 +260,136 @@ class AmazonReviewsScraper:
                 logger.warning("Empty HTML returned for %s. Stopping pagination.", page_url)
                 break
 
-            soup = BeautifulSoup(html, "lxml")
-            reviews = list(self._parse_reviews_from_soup(soup, asin=asin, start_position=len(collected) + 1))
+            reviews = self._parse_page(html, asin=asin, start_position=total + 1)
 
             if not reviews:
                 logger.info("No more reviews found at page %s.", page)
                 break
 
-            collected.extend(reviews)
-            logger.info("Page %s yielded %d reviews (total so far: %d).", page, len(reviews), len(collected))
-
-            if len(collected) >= max_reviews:
-                break
+            total += len(reviews)
+            logger.info("Page %s yielded %d reviews (total so far: %d).", page, len(reviews), total)
+            yield reviews
 
             page += 1
-            time.sleep(self.sleep_between_requests)
-
-        return collected[:max_reviews]
 
     # ----------------------- URL & HTTP Helpers -----------------------
 
     def _build_review_page_url(self, asin: str, page: int) -> str:
         return f"{self.BASE_DOMAIN}/product-reviews/{asin}?pageNumber={page}&sortBy=recent"
 
-    def _fetch_html_with_retries(self, url: str) -> Optional[str]:
+    def _fetch_html_with_retries(self, url: str) -> Optional[bytes]:
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
+
+        # Retries of the request itself (with exponential backoff, honouring
+        # Retry-After) happen inside the session's adapter, see _PacedRetry. The
+        # body is streamed after the adapter has returned, so a connection that
+        # drops or times out mid-body is retried here instead.
         for attempt in range(1, self.retry_count + 1):
+            self._bucket.acquire()
+            reading_body = False
             try:
-                response = self.session.get(url, timeout=self.timeout, proxies=self.proxies)
-                if response.status_code == 200:
-                    return response.text
-                logger.warning("Non-200 status (%s) for %s", response.status_code, url)
+                with self.session.get(url, timeout=self.timeout, proxies=self.proxies, stream=True) as response:
+                    if response.status_code != 200:
+                        retries = getattr(response.raw, "retries", None)
+                        attempts = len(retries.history) + 1 if retries is not None else 1
+                        logger.error(
+                            "Failed to fetch %s: status %s after %d attempt(s).", url, response.status_code, attempts
+                        )
+                        return None
+
+                    reading_body = True
+                    buf = bytearray()
+                    truncated = False
+                    for chunk in response.iter_content(self.CHUNK_SIZE):
+                        truncated = self._append_capped(buf, chunk, url)
+                        if truncated:
+                            break
+                    html = bytes(buf)
+                    if not truncated:
+                        self._cache_put(url, html)
+                    return html
+            except (requests.exceptions.ChunkedEncodingError, requests.ConnectionError) as exc:
+                if not reading_body:
+                    # Raised by the adapter once its own retries are exhausted.
+                    logger.error("Failed to fetch %s: %s", url, exc)
+                    return None
+                logger.warning(
+                    "Error reading body (attempt %d/%d) for %s: %s", attempt, self.retry_count, url, exc
+                )
             except requests.RequestException as exc:
+                logger.error("Failed to fetch %s: %s", url, exc)
+                return None
+        logger.error("Failed to fetch %s after %d attempts.", url, self.retry_count)
+        return None
+
+    async def _afetch(self, url: str) -> Optional[bytes]:
+        cached = self._cache_get(url)
+        if cached is not None:
+            return cached
+
+        for attempt in range(1, self.retry_count + 1):
+            await self._bucket.acquire_async()
+            try:
+                async with self._client.stream("GET", url) as response:
+                    if response.status_code == 200:
+                        buf = bytearray()
+                        truncated = False
+                        async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                            truncated = self._append_capped(buf, chunk, url)
+                            if truncated:
+                                break
+                        html = bytes(buf)
+                        if not truncated:
+                            self._cache_put(url, html)
+                        return html
+                    logger.warning("Non-200 status (%s) for %s", response.status_code, url)
+            except httpx.HTTPError as exc:
                 logger.warning("Request error (attempt %d/%d) for %s: %s", attempt, self.retry_count, url, exc)
-            time.sleep(self.sleep_between_requests * attempt)
+            await asyncio.sleep(self.sleep_between_requests * attempt)
         logger.error("Failed to fetch %s after %d attempts.", url, self.retry_count)
         return None
 
+    def _cache_get(self, url: str) -> Optional[bytes]:
+        if self.cache is None:
+            return None
+        html = self.cache.get(url)
+        if html is not None:
+            logger.debug("Cache hit for %s", url)
+        return html
+
+    def _cache_put(self, url: str, html: bytes) -> None:
+        # Only cache pages that actually contain reviews: Amazon serves its
+        # robot-check page with a 200 at the same URL, and an empty
+        # end-of-pagination page is cheap to fetch again.
+        if self.cache is not None and _has_review_markers(html):
+            self.cache.put(url, html)
+
+    def _append_capped(self, buf: bytearray, chunk: bytes, url: str) -> bool:
+        """
+        Append a raw (already content-decoded) body chunk to buf, returning
+        True once MAX_PAGE_BYTES is reached and the body must be truncated.
+        The parser detects the encoding itself, so the body is never decoded
+        to str here.
+        """
+        buf += chunk
+        if len(buf) >= self.MAX_PAGE_BYTES:
+            del buf[self.MAX_PAGE_BYTES :]
+            logger.warning("Truncating %s at %d bytes; it will not be cached.", url, self.MAX_PAGE_BYTES)
+            return True
+        return False
+
     def _extract_asin(self, url: str) -> Optional[str]:
         """
         Attempt to extract the ASIN from various common Amazon URL formats.
         """
-        parsed = urlparse(url)
-        path = parsed.path
-
-        # /dp/ASIN/...
-        m = re.search(r"/dp/([A-Z0-9]{10})", path)
+        m = _ASIN_RE.search(url)
         if m:
-            return m.group(1)
-
-        # /gp/product/ASIN/...
-        m = re.search(r"/gp/product/([A-Z0-9]{10})", path)
-        if m:
-            return m.group(1)
-
-        # /product-reviews/ASIN or query parameter ASIN=
-        m = re.search(r"/product-reviews/([A-Z0-9]{10})", path)
-        if m:
-            return m.group(1)
-
-        m = re.search(r"[?&]ASIN=([A-Z0-9]{10})", parsed.query)
-        if m:
-            return m.group(1)
+            return next(g for g in m.groups() if g)
 
         # Fallback: last path segment of length 10
-        segments = [seg for seg in path.split("/") if seg]
+        segments = [seg for seg in urlparse(url).path.split("/") if seg]
         for seg in segments[::-1]:
             if len(seg) == 10 and seg.isalnum():
                 return seg
@@ -133,82 +398,120 @@ class AmazonReviewsScraper:
 
     # ----------------------- Parsing Helpers -----------------------
 
-    def _parse_reviews_from_soup(
+    def _parse_page(self, html: bytes, asin: str, start_position: int = 1) -> List[Dict]:
+        # Pages past the end of pagination have no review blocks at all.
+        if not _has_review_markers(html):
+            return []
+
+        # Only parse the review list container when its boundaries can be found.
+        marker = html.find(_REVIEW_LIST_START)
+        if marker >= 0:
+            start = html.rfind(b"<", 0, marker)
+            end = html.find(_REVIEW_LIST_END, marker)
+            if start >= 0 and end >= 0:
+                html = html[start:end]
+
+        tree = LexborHTMLParser(html)
+        return list(self._parse_reviews_from_tree(tree, asin=asin, start_position=start_position))
+
+    def _parse_reviews_from_tree(
         self,
-        soup: BeautifulSoup,
+        tree: LexborHTMLParser,
         asin: str,
         start_position: int = 1,
     ) -> Iterable[Dict]:
-        review_blocks = soup.select("div[data-hook='review']")
+        base_domain = self.BASE_DOMAIN
         position = start_position
-        for block in review_blocks:
-            try:
-                review = self._parse_single_review(block, asin=asin, position=position)
-                if review:
-                    yield review
-                    position += 1
-            except Exception as exc:  # noqa: BLE001
-                logger.error("Error parsing review block: %s", exc, exc_info=True)
-                continue
-
-    def _parse_single_review(self, block: Tag, asin: str, position: int) -> Optional[Dict]:
-        rating_text = ""
-        rating_tag = block.select_one("i[data-hook='review-star-rating'] span.a-icon-alt") or block.select_one(
-            "span.a-icon-alt"
-        )
-        if rating_tag:
-            rating_text = rating_tag.get_text(strip=True)
-
-        rating_score = parse_rating_score(rating_text)
-
-        title_tag = block.select_one("a[data-hook='review-title'] span")
-        if not title_tag:
-            title_tag = block.select_one("a[data-hook='review-title']")
-        review_title = clean_text(title_tag.get_text(strip=True)) if title_tag else ""
-
-        link_tag = block.select_one("a[data-hook='review-title']")
-        review_url = urljoin(self.BASE_DOMAIN, link_tag["href"]) if link_tag and link_tag.has_attr("href") else ""
-
-        reaction_tag = block.select_one("span[data-hook='helpful-vote-statement']")
-        review_reaction = clean_text(reaction_tag.get_text(strip=True)) if reaction_tag else "0 people found this helpful"
-
-        reviewed_in_tag = block.select_one("span[data-hook='review-date']")
-        reviewed_in = clean_text(reviewed_in_tag.get_text(strip=True)) if reviewed_in_tag else ""
-
-        body_tag = block.select_one("span[data-hook='review-body'] span") or block.select_one(
-            "span[data-hook='review-body']"
-        )
-        review_description = clean_text(body_tag.get_text(" ", strip=True)) if body_tag else ""
-
-        verified_tag = block.select_one("span[data-hook='avp-badge']")
-        is_verified = bool(verified_tag and "Verified Purchase" in verified_tag.get_text())
-
-        variant_tag = block.select_one("a[data-hook='format-strip']")
-        variant = clean_text(variant_tag.get_text(" ", strip=True)) if variant_tag else ""
-
-        image_tags = block.select("img[data-hook='review-image-tile']")
-        review_images = []
-        for img in image_tags:
-            src = img.get("src") or img.get("data-src")
-            if src:
-                review_images.append(src)
-
-        if not review_description and not rating_score:
-            # Too empty, probably not a real review.
-            return None
+        for block in tree.css(_SEL_REVIEW_BLOCK):
+            review = _parse_single_review(block, asin, position, base_domain)
+            if review is not None:
+                yield review
+                position += 1
+
+def _has_review_markers(html: bytes) -> bool:
+    return any(marker in html for marker in _REVIEW_MARKERS)
+
+def _parse_single_review(
+    block: LexborNode,
+    asin: str,
+    position: int,
+    base_domain: str,
+    # Bound as defaults so the lookups below are local loads instead of globals.
+    _sel_rating: str = _SEL_RATING,
+    _sel_rating_fallback: str = _SEL_RATING_FALLBACK,
+    _sel_title_link: str = _SEL_TITLE_LINK,
+    _sel_reaction: str = _SEL_REACTION,
+    _sel_date: str = _SEL_DATE,
+    _sel_body_text: str = _SEL_BODY_TEXT,
+    _sel_body: str = _SEL_BODY,
+    _sel_verified: str = _SEL_VERIFIED,
+    _sel_variant: str = _SEL_VARIANT,
+    _sel_images: str = _SEL_IMAGES,
+    _clean_text: Callable[[str], str] = clean_text,
+    _parse_rating_score: Callable[[str], Optional[float]] = parse_rating_score,
+    _parse_helpful_votes: Callable[[str], int] = parse_helpful_votes,
+) -> Optional[Dict]:
+    css_first = block.css_first
+
+    rating_tag = css_first(_sel_rating) or css_first(_sel_rating_fallback)
+    rating_score = _parse_rating_score(rating_tag.text(strip=True)) if rating_tag else None
+
+    # Lexbor's scoped css_first can match the node itself, so the inner text
+    # span has to be selected from the block rather than from the body span.
+    body_tag = css_first(_sel_body_text) or css_first(_sel_body)
+    review_description = _clean_text(body_tag.text(separator=" ", strip=True)) if body_tag else ""
+
+    if not review_description and not rating_score:
+        # Too empty, probably not a real review.
+        return None
 
-        review: Dict = {
-            "productAsin": asin,
-            "ratingScore": rating_score,
-            "reviewTitle": review_title,
-            "reviewUrl": review_url,
-            "reviewReaction": review_reaction,
-            "reviewedIn": reviewed_in,
-            "reviewDescription": review_description,
-            "isVerified": is_verified,
-            "variant": variant,
-            "reviewImages": review_images,
-            "position": position,
-            "helpfulVotes": parse_helpful_votes(review_reaction),
-        }
-        return review
\ No newline at end of file
+    # The title text sits in a span inside the title link, so look the link
+    # up once and derive both the title and the review URL from it.
+    link_tag = css_first(_sel_title_link)
+    title_tag = (link_tag.css_first("span") or link_tag) if link_tag else None
+    review_title = _clean_text(title_tag.text(strip=True)) if title_tag else ""
+
+    href = link_tag.attributes.get("href") if link_tag else None
+    if href:
+        review_url = href if href.startswith("http") else base_domain + href
+    else:
+        review_url = ""
+
+    reaction_tag = css_first(_sel_reaction)
+    review_reaction = _clean_text(reaction_tag.text(strip=True)) if reaction_tag else "0 people found this helpful"
+
+    reviewed_in_tag = css_first(_sel_date)
+    reviewed_in = _clean_text(reviewed_in_tag.text(strip=True)) if reviewed_in_tag else ""
+
+    verified_tag = css_first(_sel_verified)
+    # The badge usually carries the marker in aria-label; only walk its text if not.
+    is_verified = verified_tag is not None and (
+        _VERIFIED_MARKER in (verified_tag.attributes.get("aria-label") or "")
+        or _VERIFIED_MARKER in verified_tag.text()
+    )
+
+    variant_tag = css_first(_sel_variant)
+    variant = _clean_text(variant_tag.text(separator=" ", strip=True)) if variant_tag else ""
+
+    # Node.attributes builds a fresh dict on every access, so read it once per image.
+    review_images = [
+        src
+        for attrs in (img.attributes for img in block.css(_sel_images))
+        if (src := attrs.get("src") or attrs.get("data-src"))
+    ]
+
+    review: Dict = {
+        "productAsin": asin,
+        "ratingScore": rating_score,
+        "reviewTitle": review_title,
+        "reviewUrl": review_url,
+        "reviewReaction": review_reaction,
+        "reviewedIn": reviewed_in,
+        "reviewDescription": review_description,
+        "isVerified": is_verified,
+        "variant": variant,
+        "reviewImages": review_images,
+        "position": position,
+        "helpfulVotes": _parse_helpful_votes(review_reaction),
+    }
+    return review
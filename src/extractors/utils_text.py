@@ -1,29 +1,36 @@
 import logging
 import re
-from typing import Optional
+from typing import Final, Optional, Pattern
 
-logger = logging.getLogger(__name__)
+logger: Final = logging.getLogger(__name__)
 
-_HELPFUL_RE = re.compile(r"(\d+)\s+people? found this helpful", re.IGNORECASE)
-_RATING_RE = re.compile(r"([0-5](?:\.\d)?)\s+out of\s+5", re.IGNORECASE)
+# Final module constants so an AOT compiler (e.g. mypyc) can treat them as
+# static rather than looking them up in the module dict on every call.
+_HELPFUL_RE: Final[Pattern[str]] = re.compile(r"(\d+)\s+people? found this helpful", re.IGNORECASE)
+_RATING_RE: Final[Pattern[str]] = re.compile(r"([0-5](?:\.\d)?)\s+out of\s+5", re.IGNORECASE)
+_WS_RE: Final[Pattern[str]] = re.compile(r"\s+")
 
-def clean_text(text: str) -> str:
+def clean_text(text: Optional[str]) -> str:
     """
     Normalize whitespace and strip stray characters from a string.
     """
     if text is None:
         return ""
-    cleaned = " ".join(text.split())
-    return cleaned.strip()
+    return _WS_RE.sub(" ", text).strip()
 
-def parse_helpful_votes(text: str) -> int:
+def parse_helpful_votes(text: Optional[str]) -> int:
     """
     Parse the number of helpful votes from a text like:
     "21 people found this helpful" or "One person found this helpful".
     """
-    if not text:
+    # Cheap gate before the regex; lower() only runs when the exact-case check misses.
+    if not text or ("helpful" not in text and "helpful" not in text.lower()):
         return 0
 
+    head, _, _ = text.partition(" ")
+    if head.isdecimal():
+        return int(head)
+
     match = _HELPFUL_RE.search(text)
     if match:
         try:
@@ -37,12 +44,12 @@ def parse_helpful_votes(text: str) -> int:
 
     return 0
 
-def parse_rating_score(text: str) -> Optional[float]:
+def parse_rating_score(text: Optional[str]) -> Optional[float]:
     """
     Parse rating from text like "4.0 out of 5 stars".
     Returns None if parsing fails.
     """
-    if not text:
+    if not text or ("out of" not in text and "out of" not in text.lower()):
         return None
     match = _RATING_RE.search(text)
     if match:
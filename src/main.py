@@ -28,6 +28,8 @@ def load_settings(settings_path: str) -> Dict[str, Any]:
         "proxy": None,
         "retry_count": 3,
         "sleep_between_requests": 1.0,
+        "cache_dir": None,
+        "cache_ttl": 3600,
     }
 
     if not os.path.exists(settings_path):
@@ -150,6 +152,8 @@ def main(argv: Optional[List[str]] = None) -> None:
         proxy=settings.get("proxy"),
         retry_count=settings.get("retry_count", 3),
         sleep_between_requests=float(settings.get("sleep_between_requests", 1.0)),
+        cache_dir=settings.get("cache_dir"),
+        cache_ttl=float(settings.get("cache_ttl", 3600)),
     )
 
     all_reviews: List[Dict[str, Any]] = []